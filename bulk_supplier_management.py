@@ -1,8 +1,16 @@
+import numpy as np
 import pandas as pd
+import atexit
+import functools
+import json
 import os
 import re
-from datetime import datetime
-from tabulate import tabulate
+import sqlite3
+import sys
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import date, datetime
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
@@ -10,11 +18,17 @@ from reportlab.lib.styles import getSampleStyleSheet
 import plotext as plt
 
 # ------------------- Input Validation Functions -------------------
+# Email or phone number, compiled once as a single alternation.
+_CONTACT_RE = re.compile(r'^(?:[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}|\+?1?\d{10,15})$')
+
+# Shape of the IDs issued by _next_id, used to reject malformed input before any file lookup.
+_SUPPLIER_ID_RE = re.compile(r'SUP\d{3,}')
+_PRODUCT_ID_RE = re.compile(r'PROD\d{3,}')
+_ORDER_ID_RE = re.compile(r'ORD\d{3,}')
+
 def is_valid_contact(contact):
     """Validate email or phone number format."""
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    phone_pattern = r'^\+?1?\d{10,15}$'
-    return bool(re.match(email_pattern, contact) or re.match(phone_pattern, contact))
+    return _CONTACT_RE.match(contact) is not None
 
 def is_non_empty_string(value):
     """Check if a string is non-empty after stripping whitespace."""
@@ -24,8 +38,353 @@ def is_positive_number(value):
     """Check if a value is a positive number."""
     return isinstance(value, (int, float)) and value > 0
 
+# ------------------- Storage Helpers -------------------
+# On-disk table format: "csv" (default), "feather" (faster to load, needs pyarrow)
+# or "sqlite" (one database file per table; new rows are inserted, not rewritten).
+_STORAGE = "csv"
+
+# Last issued number per table, stamped against the table file like the totals sidecar,
+# e.g. {"suppliers.csv": {"last": 42, "stamp": [mtime_ns, size]}}.
+_ID_COUNTER_PATH = ".ids.json"
+
+# Per-supplier [total_cost, order_count], kept in step with the orders table.
+_SUPPLIER_TOTALS_PATH = "supplier_totals.json"
+
+# Sidecar contents last read or written, keyed by path: (orders file stamp, totals).
+_totals_memo = {}
+
+# Parsed frames keyed by file path, stored as (stamp, DataFrame, views) where
+# `views` memoizes structures derived from that exact frame (ID sets, lookups).
+_cache = {}
+
+# Paths whose cached frame holds unsaved in-place changes -> the pending changes, each a
+# function that re-applies one change to a freshly read frame.
+_dirty = {}
+_FLUSH_EVERY = 20
+
+# Background parses started by _warm_cache: path -> Future of (stamp, DataFrame).
+_prefetched = {}
+_prefetcher = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prefetch")
+
+# Memoized validators (see _memoize_lookup), cleared on every table write.
+_lookup_caches = []
+
+def _table_path(name):
+    """Return the data file for table `name` in the configured storage format."""
+    return f"{name}.{_STORAGE}"
+
+def _file_stamp(path):
+    """Return a cheap fingerprint of a file's current contents."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def _sql_table(path):
+    """Name of the SQL table held in a per-table SQLite file, e.g. "products"."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+def _read_table(path):
+    """Parse a data file in the configured storage format."""
+    if _STORAGE == "feather":
+        return pd.read_feather(path)
+    if _STORAGE == "sqlite":
+        with closing(sqlite3.connect(path)) as conn:
+            return pd.read_sql_query(f'SELECT * FROM "{_sql_table(path)}" ORDER BY rowid', conn,
+                                     dtype=_TABLE_DTYPES.get(path))
+    return pd.read_csv(path, dtype=_TABLE_DTYPES.get(path), engine="c")
+
+def _read_cached(path):
+    """Return the parsed frame for `path`, re-reading it only when the file has changed."""
+    stamp = _file_stamp(path)
+    if path in _dirty:
+        entry = _cache[path]
+        if entry[0] == stamp:
+            # Unsaved in-memory changes are newer than the file.
+            return entry[1]
+        # Edited outside the app while changes were pending: reload and re-apply them.
+        df = _read_table(path)
+        for change in _dirty[path]:
+            change(df)
+        _cache[path] = (stamp, df, {})
+        return df
+    entry = _cache.get(path)
+    future = _prefetched.pop(path, None)
+    if entry is None or entry[0] != stamp:
+        if future is not None and future.exception() is None and future.result()[0] == stamp:
+            df = future.result()[1]
+        else:
+            df = _read_table(path)
+        entry = (stamp, df, {})
+        _cache[path] = entry
+    return entry[1]
+
+def _parse_stamped(path):
+    """Return (stamp, parsed frame) for `path`, stamped before reading so a racing write is detected."""
+    stamp = _file_stamp(path)
+    return stamp, _read_table(path)
+
+def _warm_cache(*paths):
+    """Start parsing `paths` in background threads so upcoming reads find them ready.
+
+    Workers only parse; the result is adopted into the cache by the next `_read_cached`
+    call, on the caller's thread, and only if the file has not changed since.
+    """
+    for path in paths:
+        if path in _dirty or path in _prefetched or not os.path.exists(path):
+            continue
+        entry = _cache.get(path)
+        if entry is not None and entry[0] == _file_stamp(path):
+            continue
+        _prefetched[path] = _prefetcher.submit(_parse_stamped, path)
+
+def _cached_view(path, key, build):
+    """Return `build(df)` for the cached frame at `path`, rebuilt only when the file changes."""
+    df = _read_cached(path)
+    views = _cache[path][2]
+    if key not in views:
+        views[key] = build(df)
+    return views[key]
+
+def _column_set(path, column):
+    """Return the set of values in `column` for O(1) membership checks (empty if no file)."""
+    if not os.path.exists(path):
+        return set()
+    return _cached_view(path, ("set", column), lambda df: set(df[column].to_numpy()))
+
+def _column_array(path, column):
+    """Return `column` as a cached NumPy array, for vectorized filters and positional reads."""
+    return _cached_view(path, ("array", column), lambda df: df[column].to_numpy())
+
+def _row_positions(path, column):
+    """Return a cached {value: row position} index for a unique-valued `column`."""
+    return _cached_view(path, ("positions", column),
+                        lambda df: {value: pos for pos, value in enumerate(df[column].to_numpy())})
+
+def _read_or_empty(path, columns):
+    """Return the cached frame for `path`, or an empty frame with `columns` if there is no file yet."""
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=list(columns))
+    return _read_cached(path)
+
+def _with_parsed_dates(path, column):
+    """Return the cached frame with `column` as `date` objects, parsed once per cache refresh.
+
+    to_datetime(cache=True) parses each distinct date string only once; values that are
+    not YYYY-MM-DD are kept as their original text.
+    """
+    def build(df):
+        parsed = pd.to_datetime(df[column], format="%Y-%m-%d", errors="coerce", cache=True)
+        dates = parsed.dt.date.astype(object).where(parsed.notna(), df[column])
+        return df.assign(**{column: dates})
+    return _cached_view(path, ("dates", column), build)
+
+def _cached_objects(path, cls, columns, date_column=None):
+    """Return one `cls` per row of `path`, built once per cache refresh (shared; do not modify)."""
+    def build(df):
+        if date_column:
+            df = _with_parsed_dates(path, date_column)
+        return _frame_to_objects(df, cls, columns)
+    return _cached_view(path, "objects", build)
+
+def _objects_by_id(path, cls, columns, date_column=None):
+    """Return a cached {id: object} index over `_cached_objects`, keyed by the first column."""
+    objects = _cached_objects(path, cls, columns, date_column)
+    return _cached_view(path, "by_id", lambda df: {getattr(o, columns[0]): o for o in objects})
+
+def _rows_matching(df, column, value):
+    """Return a boolean NumPy mask of the rows whose `column` equals `value` (missing values never match)."""
+    return (df[column] == value).to_numpy(dtype=bool, na_value=False)
+
+def _memoize_lookup(func):
+    """LRU-cache a validator's answers until the next table write (see _invalidate_lookups)."""
+    cached = functools.lru_cache(maxsize=4096)(func)
+    _lookup_caches.append(cached)
+    return cached
+
+def _invalidate_lookups():
+    """Forget every memoized validator answer."""
+    for cached in _lookup_caches:
+        cached.cache_clear()
+
+def _lookup_set(path, column):
+    """Like `_column_set`, but reports read errors and returns an empty set (for validators)."""
+    try:
+        return _column_set(path, column)
+    except Exception as e:
+        print(f"❌ Error reading {path}: {e}")
+        return set()
+
+def _write_table(df, path):
+    """Write `df` to `path` and drop any cached copy of the old contents."""
+    _invalidate_lookups()
+    _flush_others(path)
+    before = _stamp_or_none(path)
+    if _STORAGE == "feather":
+        df.reset_index(drop=True).to_feather(path)
+    elif _STORAGE == "sqlite":
+        with closing(sqlite3.connect(path)) as conn:
+            df.to_sql(_sql_table(path), conn, if_exists="replace", index=False)
+    else:
+        df.to_csv(path, index=False)
+    _cache.pop(path, None)
+    _dirty.pop(path, None)
+    _restamp_id_counter(path, before)
+
+def _mark_dirty(path, replay, keep=()):
+    """Record an in-place change to the cached frame; it is written out every _FLUSH_EVERY changes.
+
+    `replay(df)` re-applies the change if the file is reloaded before then. Cached views
+    are dropped except those named in `keep`, which the change must not affect.
+    """
+    _invalidate_lookups()
+    views = _cache[path][2]
+    for key in [key for key in views if key not in keep]:
+        del views[key]
+    _dirty.setdefault(path, []).append(replay)
+    if len(_dirty[path]) >= _FLUSH_EVERY:
+        _flush(path)
+
+def _flush(path):
+    """Write the cached frame for `path` to disk if it has unsaved changes."""
+    if path not in _dirty:
+        return
+    df = _read_cached(path)
+    changes = _dirty.pop(path)
+    try:
+        _write_table(df, path)
+    except Exception:
+        _dirty[path] = changes
+        raise
+
+def _flush_others(path):
+    """Write pending changes to every table but `path`, so they reach disk before a write to it."""
+    for other in [other for other in _dirty if other != path]:
+        _flush(other)
+
+@atexit.register
+def _flush_pending():
+    """Write every table with unsaved in-memory changes back to disk."""
+    for path in list(_dirty):
+        try:
+            _flush(path)
+        except Exception as e:
+            print(f"❌ Error saving {path}: {e}")
+
+def _append_row(record, path, columns):
+    """Add one record to the end of a table without rewriting existing rows."""
+    _invalidate_lookups()
+    _flush_others(path)
+    _flush(path)
+    df = pd.DataFrame([record], columns=list(columns))
+    before = _stamp_or_none(path)
+    if _STORAGE == "sqlite":
+        # Plain INSERTs; existing rows are left alone.
+        with closing(sqlite3.connect(path)) as conn:
+            df.to_sql(_sql_table(path), conn, if_exists="append", index=False)
+        _cache.pop(path, None)
+        _restamp_id_counter(path, before)
+        return
+    if _STORAGE != "csv":
+        # Feather files cannot be appended to in place.
+        if os.path.exists(path):
+            df = pd.concat([_read_cached(path), df], ignore_index=True)
+        _write_table(df, path)
+        return
+    # Same writer as full rewrites, so appended rows are formatted identically.
+    df.to_csv(path, mode="a", header=not os.path.exists(path), index=False)
+    _cache.pop(path, None)
+    _restamp_id_counter(path, before)
+
+def _stamp_or_none(path):
+    """Return `_file_stamp(path)` as stored in JSON sidecars, or None if there is no file yet."""
+    return list(_file_stamp(path)) if os.path.exists(path) else None
+
+def _load_id_counters():
+    """Return the saved ID counters, or {} if there are none."""
+    try:
+        with open(_ID_COUNTER_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_id_counters(counters):
+    """Store the ID counters."""
+    with open(_ID_COUNTER_PATH, "w", encoding="utf-8") as f:
+        json.dump(counters, f)
+
+def _restamp_id_counter(path, before):
+    """After an in-app write to `path`, re-stamp its counter if it was current before the write.
+
+    A counter that was already stale stays stale, so an outside edit still forces a rescan.
+    """
+    counters = _load_id_counters()
+    entry = counters.get(path)
+    if not isinstance(entry, dict) or entry.get("stamp") != before:
+        return
+    entry["stamp"] = _stamp_or_none(path)
+    _save_id_counters(counters)
+
+def _next_id(prefix, path, id_column):
+    """Issue the next `prefix` ID from the counter file, scanning the table only when it changed outside the app."""
+    counters = _load_id_counters()
+    entry = counters.get(path)
+    if not isinstance(entry, dict):
+        entry = {}
+    stamp = _stamp_or_none(path)
+    if stamp is None:
+        last = 0
+    else:
+        last = entry.get("last", 0)
+        if entry.get("stamp") != stamp:
+            # New counter, or rows added outside the app: never reissue an existing ID.
+            ids = _read_cached(path)[id_column].astype(str).str.replace(prefix, "", regex=False)
+            numbers = pd.to_numeric(ids, errors="coerce").dropna()
+            if not numbers.empty:
+                last = max(last, int(numbers.max()))
+    counters[path] = {"last": last + 1, "stamp": stamp}
+    _save_id_counters(counters)
+    return f"{prefix}{last + 1:03d}"
+
+def _lowercase(path, column):
+    """Return `column` lowercased once per cache refresh, for case-insensitive search."""
+    return _cached_view(path, ("lower", column), lambda df: df[column].str.lower())
+
+def _contains(lowercased, term):
+    """Literal substring match of a lowercase `term` against a lowercased column."""
+    return lowercased.str.contains(term, regex=False, na=False)
+
+def _search_positions(path, columns, search_term):
+    """Return the row positions where any of `columns` contains `search_term` (case-insensitive)."""
+    term = search_term.lower()
+    mask = np.zeros(len(_read_cached(path)), dtype=bool)
+    for column in columns:
+        mask |= _contains(_lowercase(path, column), term).to_numpy()
+    return np.flatnonzero(mask)
+
+def _frame_to_objects(df, cls, columns):
+    """Build one `cls` per row by zipping the raw column arrays (no per-row Series)."""
+    return [cls(*row) for row in zip(*_column_values(df, columns))]
+
+def _cached_rows(path, columns):
+    """Return the rows of `path` as tuples of `columns`, built once per cache refresh (shared)."""
+    return _cached_view(path, ("tuples", columns), lambda df: list(zip(*_column_values(df, columns))))
+
+def _intern_id(value):
+    """Return the canonical copy of an ID string (anything else unchanged)."""
+    return sys.intern(value) if type(value) is str else value
+
+def _column_values(df, columns):
+    """Return the raw arrays for `columns`, with the *_id columns interned.
+
+    IDs repeat across rows (e.g. one supplier on many orders), so interning makes every
+    occurrence share a single string and lets equal IDs compare by identity.
+    """
+    return [list(map(_intern_id, df[c].to_numpy())) if c.endswith("_id") else df[c].to_numpy()
+            for c in columns]
+
 # ------------------- Supplier Class -------------------
 class Supplier:
+    __slots__ = ("supplier_id", "name", "location", "contact_info")
+
     def __init__(self, supplier_id, name, location, contact_info):
         self.supplier_id = supplier_id
         self.name = name
@@ -51,51 +410,41 @@ class Supplier:
 
 # ------------------- Supplier Manager Class -------------------
 class SupplierManager:
-    FILE_PATH = "suppliers.csv"
+    FILE_PATH = _table_path("suppliers")
+    COLUMNS = ("supplier_id", "name", "location", "contact_info")
+    DTYPES = {"supplier_id": "string", "name": "string", "location": "string", "contact_info": "string"}
 
     @staticmethod
     def load_suppliers():
         try:
             if not os.path.exists(SupplierManager.FILE_PATH):
                 return []
-            df = pd.read_csv(SupplierManager.FILE_PATH)
-            return [Supplier.from_dict(row) for _, row in df.iterrows()]
+            return list(_cached_objects(SupplierManager.FILE_PATH, Supplier, SupplierManager.COLUMNS))
         except Exception as e:
             print(f"❌ Error reading suppliers file: {e}")
             return []
 
     @staticmethod
     def get_next_supplier_id():
-        suppliers = SupplierManager.load_suppliers()
-        if not suppliers:
-            return "SUP001"
-        last_id = suppliers[-1].supplier_id
-        num = int(last_id.replace("SUP", ""))
-        return f"SUP{num + 1:03d}"
+        return _next_id("SUP", SupplierManager.FILE_PATH, "supplier_id")
 
     @staticmethod
     def save_supplier(supplier):
         try:
-            df = pd.DataFrame([supplier.to_dict()])
-            if not os.path.exists(SupplierManager.FILE_PATH):
-                df.to_csv(SupplierManager.FILE_PATH, index=False)
-            else:
-                existing_df = pd.read_csv(SupplierManager.FILE_PATH)
-                new_df = pd.concat([existing_df, df], ignore_index=True)
-                new_df.to_csv(SupplierManager.FILE_PATH, index=False)
+            _append_row(supplier.to_dict(), SupplierManager.FILE_PATH, SupplierManager.COLUMNS)
         except Exception as e:
             print(f"❌ Error saving supplier: {e}")
 
     @staticmethod
     def update_supplier(supplier_id, updated_supplier):
         try:
-            df = pd.read_csv(SupplierManager.FILE_PATH)
-            if supplier_id not in df["supplier_id"].values:
+            if supplier_id not in _column_set(SupplierManager.FILE_PATH, "supplier_id"):
                 return False
+            df = _read_cached(SupplierManager.FILE_PATH).copy()
             df.loc[df["supplier_id"] == supplier_id, ["name", "location", "contact_info"]] = [
                 updated_supplier.name, updated_supplier.location, updated_supplier.contact_info
             ]
-            df.to_csv(SupplierManager.FILE_PATH, index=False)
+            _write_table(df, SupplierManager.FILE_PATH)
             return True
         except Exception as e:
             print(f"❌ Error updating supplier: {e}")
@@ -105,37 +454,43 @@ class SupplierManager:
     def delete_supplier(supplier_id):
         try:
             # Check for dependencies
-            products_df = pd.read_csv(ProductManager.FILE_PATH) if os.path.exists(ProductManager.FILE_PATH) else pd.DataFrame()
-            orders_df = pd.read_csv(OrderManager.FILE_PATH) if os.path.exists(OrderManager.FILE_PATH) else pd.DataFrame()
-            if not products_df.empty and supplier_id in products_df["supplier_id"].values:
+            if supplier_id in _column_set(ProductManager.FILE_PATH, "supplier_id"):
                 return False, "Cannot delete supplier with associated products."
-            if not orders_df.empty and supplier_id in orders_df["supplier_id"].values:
+            if supplier_id in _column_set(OrderManager.FILE_PATH, "supplier_id"):
                 return False, "Cannot delete supplier with associated orders."
             
-            df = pd.read_csv(SupplierManager.FILE_PATH)
-            if supplier_id not in df["supplier_id"].values:
+            df = _read_cached(SupplierManager.FILE_PATH)
+            rows = _rows_matching(df, "supplier_id", supplier_id)
+            if not rows.any():
                 return False, "Supplier ID not found."
-            df = df[df["supplier_id"] != supplier_id]
-            df.to_csv(SupplierManager.FILE_PATH, index=False)
+            _write_table(df[~rows], SupplierManager.FILE_PATH)
             return True, "Supplier deleted successfully."
         except Exception as e:
             return False, f"Error deleting supplier: {e}"
 
     @staticmethod
+    @_memoize_lookup
     def is_valid_supplier_id(supplier_id):
-        suppliers = SupplierManager.load_suppliers()
-        return any(s.supplier_id == supplier_id for s in suppliers)
+        if _SUPPLIER_ID_RE.fullmatch(supplier_id) is None:
+            return False
+        return supplier_id in _lookup_set(SupplierManager.FILE_PATH, "supplier_id")
 
     @staticmethod
     def search_suppliers(search_term):
-        suppliers = SupplierManager.load_suppliers()
-        return [
-            s for s in suppliers
-            if search_term.lower() in s.name.lower() or search_term.lower() in s.location.lower()
-        ]
+        try:
+            if not os.path.exists(SupplierManager.FILE_PATH):
+                return []
+            suppliers = _cached_objects(SupplierManager.FILE_PATH, Supplier, SupplierManager.COLUMNS)
+            positions = _search_positions(SupplierManager.FILE_PATH, ("name", "location"), search_term)
+            return [suppliers[i] for i in positions]
+        except Exception as e:
+            print(f"❌ Error searching suppliers: {e}")
+            return []
 
 # ------------------- Product Class -------------------
 class Product:
+    __slots__ = ("product_id", "name", "sku", "cost_per_unit", "moq", "available_qty", "supplier_id")
+
     def __init__(self, product_id, name, sku, cost_per_unit, moq, available_qty, supplier_id):
         self.product_id = product_id
         self.name = name
@@ -170,47 +525,59 @@ class Product:
 
 # ------------------- Product Manager Class -------------------
 class ProductManager:
-    FILE_PATH = "products.csv"
+    FILE_PATH = _table_path("products")
+    COLUMNS = ("product_id", "name", "sku", "cost_per_unit", "moq", "available_qty", "supplier_id")
+    LOW_STOCK_COLUMNS = ("product_id", "name", "sku", "available_qty", "supplier_id")
+    DTYPES = {"product_id": "string", "name": "string", "sku": "string", "cost_per_unit": "float64",
+              "moq": "int64", "available_qty": "int64", "supplier_id": "string"}
 
     @staticmethod
     def load_products():
         try:
             if not os.path.exists(ProductManager.FILE_PATH):
                 return []
-            df = pd.read_csv(ProductManager.FILE_PATH)
-            return [Product.from_dict(row) for _, row in df.iterrows()]
+            return list(_cached_objects(ProductManager.FILE_PATH, Product, ProductManager.COLUMNS))
         except Exception as e:
             print(f"❌ Error reading products file: {e}")
             return []
 
+    @staticmethod
+    def get_rows():
+        try:
+            if not os.path.exists(ProductManager.FILE_PATH):
+                return []
+            return _cached_rows(ProductManager.FILE_PATH, ProductManager.COLUMNS)
+        except Exception as e:
+            print(f"❌ Error reading products file: {e}")
+            return []
+
+    @staticmethod
+    def get_product(product_id):
+        try:
+            if _PRODUCT_ID_RE.fullmatch(product_id) is None or not os.path.exists(ProductManager.FILE_PATH):
+                return None
+            return _objects_by_id(ProductManager.FILE_PATH, Product, ProductManager.COLUMNS).get(product_id)
+        except Exception as e:
+            print(f"❌ Error reading products file: {e}")
+            return None
+
     @staticmethod
     def get_next_product_id():
-        products = ProductManager.load_products()
-        if not products:
-            return "PROD001"
-        last_id = products[-1].product_id
-        num = int(last_id.replace("PROD", ""))
-        return f"PROD{num + 1:03d}"
+        return _next_id("PROD", ProductManager.FILE_PATH, "product_id")
 
     @staticmethod
     def save_product(product):
         try:
-            df = pd.DataFrame([product.to_dict()])
-            if not os.path.exists(ProductManager.FILE_PATH):
-                df.to_csv(ProductManager.FILE_PATH, index=False)
-            else:
-                existing_df = pd.read_csv(ProductManager.FILE_PATH)
-                new_df = pd.concat([existing_df, df], ignore_index=True)
-                new_df.to_csv(ProductManager.FILE_PATH, index=False)
+            _append_row(product.to_dict(), ProductManager.FILE_PATH, ProductManager.COLUMNS)
         except Exception as e:
             print(f"❌ Error saving product: {e}")
 
     @staticmethod
     def update_product(product_id, updated_product):
         try:
-            df = pd.read_csv(ProductManager.FILE_PATH)
-            if product_id not in df["product_id"].values:
-                return False
+            if product_id not in _column_set(ProductManager.FILE_PATH, "product_id"):
+                return False, "Product ID not found."
+            df = _read_cached(ProductManager.FILE_PATH).copy()
             # Check SKU uniqueness, excluding current product
             if updated_product.sku != df.loc[df["product_id"] == product_id, "sku"].iloc[0]:
                 if not ProductManager.is_unique_sku(updated_product.sku):
@@ -219,7 +586,7 @@ class ProductManager:
                 updated_product.name, updated_product.sku, updated_product.cost_per_unit,
                 updated_product.moq, updated_product.available_qty, updated_product.supplier_id
             ]
-            df.to_csv(ProductManager.FILE_PATH, index=False)
+            _write_table(df, ProductManager.FILE_PATH)
             return True, "Product updated successfully."
         except Exception as e:
             return False, f"Error updating product: {e}"
@@ -228,77 +595,127 @@ class ProductManager:
     def delete_product(product_id):
         try:
             # Check for dependencies
-            orders_df = pd.read_csv(OrderManager.FILE_PATH) if os.path.exists(OrderManager.FILE_PATH) else pd.DataFrame()
-            sales_df = pd.read_csv(SalesManager.FILE_PATH) if os.path.exists(SalesManager.FILE_PATH) else pd.DataFrame()
-            if not orders_df.empty and product_id in orders_df["product_id"].values:
+            if product_id in _column_set(OrderManager.FILE_PATH, "product_id"):
                 return False, "Cannot delete product with associated orders."
-            if not sales_df.empty and product_id in sales_df["product_id"].values:
+            if product_id in _column_set(SalesManager.FILE_PATH, "product_id"):
                 return False, "Cannot delete product with associated sales."
             
-            df = pd.read_csv(ProductManager.FILE_PATH)
-            if product_id not in df["product_id"].values:
+            df = _read_cached(ProductManager.FILE_PATH)
+            rows = _rows_matching(df, "product_id", product_id)
+            if not rows.any():
                 return False, "Product ID not found."
-            df = df[df["product_id"] != product_id]
-            df.to_csv(ProductManager.FILE_PATH, index=False)
+            _write_table(df[~rows], ProductManager.FILE_PATH)
             return True, "Product deleted successfully."
         except Exception as e:
             return False, f"Error deleting product: {e}"
 
     @staticmethod
+    @_memoize_lookup
     def is_valid_product_id(product_id):
-        products = ProductManager.load_products()
-        return any(p.product_id == product_id for p in products)
+        if _PRODUCT_ID_RE.fullmatch(product_id) is None:
+            return False
+        return product_id in _lookup_set(ProductManager.FILE_PATH, "product_id")
 
     @staticmethod
+    @_memoize_lookup
     def is_unique_sku(sku):
-        products = ProductManager.load_products()
-        return not any(p.sku == sku for p in products)
+        return sku not in _lookup_set(ProductManager.FILE_PATH, "sku")
+
+    @staticmethod
+    def _position(product_id):
+        if _PRODUCT_ID_RE.fullmatch(product_id) is None or not os.path.exists(ProductManager.FILE_PATH):
+            return None
+        return _row_positions(ProductManager.FILE_PATH, "product_id").get(product_id)
 
     @staticmethod
     def validate_order_quantity(product_id, quantity):
-        products = ProductManager.load_products()
-        product = next((p for p in products if p.product_id == product_id), None)
-        if not product:
+        try:
+            pos = ProductManager._position(product_id)
+            if pos is not None:
+                moq = _column_array(ProductManager.FILE_PATH, "moq")[pos]
+                available_qty = _column_array(ProductManager.FILE_PATH, "available_qty")[pos]
+        except Exception as e:
+            print(f"❌ Error reading products file: {e}")
+            pos = None
+        if pos is None:
             return False, "Product not found."
         if not is_positive_number(quantity):
             return False, "Quantity must be a positive number."
-        if quantity < product.moq:
-            return False, f"Quantity must be at least {product.moq} (MOQ)."
-        if quantity > product.available_qty:
-            return False, f"Only {product.available_qty} units available."
+        if quantity < moq:
+            return False, f"Quantity must be at least {moq} (MOQ)."
+        if quantity > available_qty:
+            return False, f"Only {available_qty} units available."
         return True, ""
 
     @staticmethod
     def search_products(search_term):
-        products = ProductManager.load_products()
-        return [
-            p for p in products
-            if search_term.lower() in p.name.lower() or search_term.lower() in p.sku.lower()
-        ]
+        try:
+            if not os.path.exists(ProductManager.FILE_PATH):
+                return []
+            products = _cached_objects(ProductManager.FILE_PATH, Product, ProductManager.COLUMNS)
+            positions = _search_positions(ProductManager.FILE_PATH, ("name", "sku"), search_term)
+            return [products[i] for i in positions]
+        except Exception as e:
+            print(f"❌ Error searching products: {e}")
+            return []
 
     @staticmethod
     def get_low_stock_products(threshold=10):
-        products = ProductManager.load_products()
-        return [p for p in products if p.available_qty <= threshold]
+        try:
+            if not os.path.exists(ProductManager.FILE_PATH):
+                return []
+            products = _cached_objects(ProductManager.FILE_PATH, Product, ProductManager.COLUMNS)
+            quantities = _column_array(ProductManager.FILE_PATH, "available_qty")
+            return [products[i] for i in np.flatnonzero(quantities <= threshold)]
+        except Exception as e:
+            print(f"❌ Error reading products file: {e}")
+            return []
+
+    @staticmethod
+    def iter_low_stock_rows(threshold=10):
+        try:
+            if not os.path.exists(ProductManager.FILE_PATH):
+                return
+            quantities = _column_array(ProductManager.FILE_PATH, "available_qty")
+            positions = np.flatnonzero(quantities <= threshold)
+            # Gather just the matching entries of each column; no per-product tuples.
+            columns = [_column_array(ProductManager.FILE_PATH, c)[positions]
+                       for c in ProductManager.LOW_STOCK_COLUMNS]
+        except Exception as e:
+            print(f"❌ Error reading products file: {e}")
+            return
+        yield from zip(*columns)
 
     @staticmethod
     def update_product_quantity(product_id, quantity_change):
         try:
-            df = pd.read_csv(ProductManager.FILE_PATH)
-            if product_id not in df["product_id"].values:
+            pos = ProductManager._position(product_id)
+            if pos is None:
                 return False, "Product not found."
-            current_qty = df.loc[df["product_id"] == product_id, "available_qty"].iloc[0]
+            df = _read_cached(ProductManager.FILE_PATH)
+            column = df.columns.get_loc("available_qty")
+            current_qty = df.iat[pos, column]
             new_qty = current_qty + quantity_change
             if new_qty < 0:
                 return False, f"Cannot reduce quantity below 0. Current quantity: {current_qty}."
-            df.loc[df["product_id"] == product_id, "available_qty"] = new_qty
-            df.to_csv(ProductManager.FILE_PATH, index=False)
+            # Update the cached frame in place; the file is rewritten on the next flush.
+            df.iat[pos, column] = new_qty
+
+            def replay(df):
+                df.loc[df["product_id"] == product_id, "available_qty"] += quantity_change
+
+            # Only available_qty changed: ID lookups and the other columns' arrays stay valid.
+            unchanged = [("array", c) for c in ProductManager.COLUMNS if c != "available_qty"]
+            _mark_dirty(ProductManager.FILE_PATH, replay,
+                        keep=(("positions", "product_id"), ("set", "product_id"), *unchanged))
             return True, f"Updated quantity to {new_qty}."
         except Exception as e:
             return False, f"Error updating product quantity: {e}"
 
 # ------------------- Order Class -------------------
 class Order:
+    __slots__ = ("order_id", "product_id", "supplier_id", "quantity", "total_cost", "order_date", "delivery_status")
+
     def __init__(self, order_id, product_id, supplier_id, quantity, total_cost, order_date, delivery_status):
         self.order_id = order_id
         self.product_id = product_id
@@ -333,47 +750,52 @@ class Order:
 
 # ------------------- Order Manager Class -------------------
 class OrderManager:
-    FILE_PATH = "orders.csv"
+    FILE_PATH = _table_path("orders")
+    COLUMNS = ("order_id", "product_id", "supplier_id", "quantity", "total_cost", "order_date", "delivery_status")
+    DTYPES = {"order_id": "string", "product_id": "string", "supplier_id": "string", "quantity": "int64",
+              "total_cost": "float64", "order_date": "string", "delivery_status": "string"}
 
     @staticmethod
     def load_orders():
         try:
             if not os.path.exists(OrderManager.FILE_PATH):
                 return []
-            df = pd.read_csv(OrderManager.FILE_PATH)
-            return [Order.from_dict(row) for _, row in df.iterrows()]
+            return list(_cached_objects(OrderManager.FILE_PATH, Order, OrderManager.COLUMNS, "order_date"))
         except Exception as e:
             print(f"❌ Error reading orders file: {e}")
             return []
 
+    @staticmethod
+    def get_order(order_id):
+        try:
+            if _ORDER_ID_RE.fullmatch(order_id) is None or not os.path.exists(OrderManager.FILE_PATH):
+                return None
+            return _objects_by_id(OrderManager.FILE_PATH, Order, OrderManager.COLUMNS, "order_date").get(order_id)
+        except Exception as e:
+            print(f"❌ Error reading orders file: {e}")
+            return None
+
     @staticmethod
     def get_next_order_id():
-        orders = OrderManager.load_orders()
-        if not orders:
-            return "ORD001"
-        last_id = orders[-1].order_id
-        num = int(last_id.replace("ORD", ""))
-        return f"ORD{num + 1:03d}"
+        return _next_id("ORD", OrderManager.FILE_PATH, "order_id")
 
     @staticmethod
     def save_order(order):
         try:
-            df = pd.DataFrame([order.to_dict()])
-            if not os.path.exists(OrderManager.FILE_PATH):
-                df.to_csv(OrderManager.FILE_PATH, index=False)
-            else:
-                existing_df = pd.read_csv(OrderManager.FILE_PATH)
-                new_df = pd.concat([existing_df, df], ignore_index=True)
-                new_df.to_csv(OrderManager.FILE_PATH, index=False)
+            totals = _load_supplier_totals()
+            _append_row(order.to_dict(), OrderManager.FILE_PATH, OrderManager.COLUMNS)
+            if totals is not None:
+                _adjust_supplier_totals(totals, order.supplier_id, float(order.total_cost), 1)
+                _save_supplier_totals(totals)
         except Exception as e:
             print(f"❌ Error saving order: {e}")
 
     @staticmethod
     def update_order_status(order_id, new_status):
         try:
-            df = pd.read_csv(OrderManager.FILE_PATH)
-            if order_id not in df["order_id"].values:
+            if order_id not in _column_set(OrderManager.FILE_PATH, "order_id"):
                 return False, "Order ID not found."
+            df = _read_cached(OrderManager.FILE_PATH).copy()
             # If status changes to Delivered, update product quantity
             if new_status.lower() == "delivered":
                 order = df[df["order_id"] == order_id]
@@ -383,7 +805,11 @@ class OrderManager:
                 if not success:
                     return False, message
             df.loc[df["order_id"] == order_id, "delivery_status"] = new_status
-            df.to_csv(OrderManager.FILE_PATH, index=False)
+            totals = _load_supplier_totals()
+            _write_table(df, OrderManager.FILE_PATH)
+            if totals is not None:
+                # Costs are unchanged; just re-stamp the totals against the new file.
+                _save_supplier_totals(totals)
             return True, f"Order {order_id} status updated to {new_status}."
         except Exception as e:
             return False, f"Error updating order status: {e}"
@@ -391,38 +817,49 @@ class OrderManager:
     @staticmethod
     def delete_order(order_id):
         try:
-            df = pd.read_csv(OrderManager.FILE_PATH)
-            if order_id not in df["order_id"].values:
+            df = _read_cached(OrderManager.FILE_PATH)
+            rows = _rows_matching(df, "order_id", order_id)
+            if not rows.any():
                 return False, "Order ID not found."
-            df = df[df["order_id"] != order_id]
-            df.to_csv(OrderManager.FILE_PATH, index=False)
+            totals = _load_supplier_totals()
+            removed = df[rows]
+            _write_table(df[~rows], OrderManager.FILE_PATH)
+            if totals is not None:
+                for supplier_id, cost in zip(removed["supplier_id"].to_numpy(), removed["total_cost"].to_numpy()):
+                    _adjust_supplier_totals(totals, supplier_id, -float(cost), -1)
+                _save_supplier_totals(totals)
             return True, "Order deleted successfully."
         except Exception as e:
             return False, f"Error deleting order: {e}"
 
     @staticmethod
     def search_orders(search_term):
-        orders = OrderManager.load_orders()
-        return [
-            o for o in orders
-            if search_term.lower() in o.delivery_status.lower() or
-               search_term.lower() in str(o.order_date)
-        ]
+        try:
+            if not os.path.exists(OrderManager.FILE_PATH):
+                return []
+            orders = _cached_objects(OrderManager.FILE_PATH, Order, OrderManager.COLUMNS, "order_date")
+            positions = _search_positions(OrderManager.FILE_PATH, ("delivery_status", "order_date"), search_term)
+            return [orders[i] for i in positions]
+        except Exception as e:
+            print(f"❌ Error searching orders: {e}")
+            return []
 
     @staticmethod
     def get_order_summary_by_supplier():
         try:
-            df = pd.read_csv(OrderManager.FILE_PATH)
-            if df.empty:
-                return []
-            summary = df.groupby("supplier_id")["total_cost"].sum().reset_index()
-            return summary.to_dict(orient="records")
+            totals = _load_supplier_totals()
+            if totals is None:
+                totals = _supplier_totals(_read_or_empty(OrderManager.FILE_PATH, OrderManager.COLUMNS))
+                _save_supplier_totals(totals)
+            return _order_summary(totals)
         except Exception as e:
             print(f"❌ Error generating order summary: {e}")
-            return []
+            return pd.DataFrame(columns=["supplier_id", "total_cost"])
 
 # ------------------- Sale Class -------------------
 class Sale:
+    __slots__ = ("sale_id", "product_id", "quantity_sold", "sale_date")
+
     def __init__(self, sale_id, product_id, quantity_sold, sale_date):
         self.sale_id = sale_id
         self.product_id = product_id
@@ -448,82 +885,162 @@ class Sale:
 
 # ------------------- Sales Manager Class -------------------
 class SalesManager:
-    FILE_PATH = "sales.csv"
+    FILE_PATH = _table_path("sales")
+    COLUMNS = ("sale_id", "product_id", "quantity_sold", "sale_date")
+    DTYPES = {"sale_id": "string", "product_id": "string", "quantity_sold": "int64", "sale_date": "string"}
 
     @staticmethod
     def load_sales():
         try:
             if not os.path.exists(SalesManager.FILE_PATH):
                 return []
-            df = pd.read_csv(SalesManager.FILE_PATH)
-            return [Sale.from_dict(row) for _, row in df.iterrows()]
+            return list(_cached_objects(SalesManager.FILE_PATH, Sale, SalesManager.COLUMNS, "sale_date"))
         except Exception as e:
             print(f"❌ Error reading sales file: {e}")
             return []
 
     @staticmethod
     def get_next_sale_id():
-        sales = SalesManager.load_sales()
-        if not sales:
-            return "SALE001"
-        last_id = sales[-1].sale_id
-        num = int(last_id.replace("SALE", ""))
-        return f"SALE{num + 1:03d}"
+        return _next_id("SALE", SalesManager.FILE_PATH, "sale_id")
 
     @staticmethod
     def save_sale(sale):
         try:
-            df = pd.DataFrame([sale.to_dict()])
-            if not os.path.exists(SalesManager.FILE_PATH):
-                df.to_csv(SalesManager.FILE_PATH, index=False)
-            else:
-                existing_df = pd.read_csv(SalesManager.FILE_PATH)
-                new_df = pd.concat([existing_df, df], ignore_index=True)
-                new_df.to_csv(SalesManager.FILE_PATH, index=False)
+            _append_row(sale.to_dict(), SalesManager.FILE_PATH, SalesManager.COLUMNS)
         except Exception as e:
             print(f"❌ Error saving sale: {e}")
 
     @staticmethod
     def get_sales_summary():
         try:
-            sales_df = pd.read_csv(SalesManager.FILE_PATH) if os.path.exists(SalesManager.FILE_PATH) else pd.DataFrame()
-            products_df = pd.read_csv(ProductManager.FILE_PATH) if os.path.exists(ProductManager.FILE_PATH) else pd.DataFrame()
-            if sales_df.empty or products_df.empty:
-                return []
-            summary = sales_df.groupby("product_id")["quantity_sold"].sum().reset_index()
-            summary = summary.merge(products_df[["product_id", "name", "cost_per_unit"]], on="product_id", how="left")
-            summary["total_revenue"] = summary["quantity_sold"] * summary["cost_per_unit"]
-            return summary.to_dict(orient="records")
+            sales_df = _read_or_empty(SalesManager.FILE_PATH, SalesManager.COLUMNS)
+            products_df = _read_or_empty(ProductManager.FILE_PATH, ProductManager.COLUMNS)
+            return _sales_summary(sales_df, products_df).to_dict(orient="records")
         except Exception as e:
             print(f"❌ Error generating sales summary: {e}")
             return []
 
     @staticmethod
-    def get_product_sales(product_id):
+    def get_product_sales(product_id, sales_df=None):
         try:
-            sales_df = pd.read_csv(SalesManager.FILE_PATH) if os.path.exists(SalesManager.FILE_PATH) else pd.DataFrame()
-            if sales_df.empty or product_id not in sales_df["product_id"].values:
-                return []
+            if sales_df is None:
+                sales_df = _read_or_empty(SalesManager.FILE_PATH, SalesManager.COLUMNS)
             product_sales = sales_df[sales_df["product_id"] == product_id]
-            return [Sale.from_dict(row) for _, row in product_sales.iterrows()]
+            rows = product_sales[list(SalesManager.COLUMNS)].itertuples(index=False, name=None)
+            return [Sale(*row) for row in rows]
         except Exception as e:
             print(f"❌ Error retrieving product sales: {e}")
             return []
 
+# ------------------- Storage Migration -------------------
+# Column dtypes per data file, passed to the CSV parser so it skips type inference.
+_TABLE_DTYPES = {
+    manager.FILE_PATH: manager.DTYPES
+    for manager in (SupplierManager, ProductManager, OrderManager, SalesManager)
+}
+
+def migrate_csv_tables():
+    """Convert legacy CSV tables into the configured storage format (one-time, no-op for CSV)."""
+    if _STORAGE == "csv":
+        return
+    for manager in (SupplierManager, ProductManager, OrderManager, SalesManager):
+        legacy_path = os.path.splitext(manager.FILE_PATH)[0] + ".csv"
+        if os.path.exists(legacy_path) and not os.path.exists(manager.FILE_PATH):
+            try:
+                _write_table(pd.read_csv(legacy_path, dtype=manager.DTYPES), manager.FILE_PATH)
+                print(f"✅ Migrated {legacy_path} to {manager.FILE_PATH}")
+            except Exception as e:
+                print(f"❌ Error migrating {legacy_path}: {e}")
+
+# ------------------- Report Aggregations -------------------
+# Pure functions over already-loaded frames, so a report can share one load per table.
+def _supplier_totals(orders_df):
+    """Map each supplier to [total order cost, number of orders]."""
+    # Hash grouping only; _order_summary sorts the (few) suppliers itself.
+    grouped = orders_df.groupby("supplier_id", sort=False)["total_cost"].agg(["sum", "count"])
+    return {supplier_id: [float(total), int(count)]
+            for supplier_id, total, count in zip(grouped.index, grouped["sum"], grouped["count"])}
+
+def _order_summary(totals):
+    """Total order cost per supplier as a frame, ordered by supplier ID."""
+    supplier_ids = sorted(totals)
+    return pd.DataFrame({
+        "supplier_id": supplier_ids,
+        "total_cost": [totals[supplier_id][0] for supplier_id in supplier_ids],
+    })
+
+def _sales_summary(sales_df, products_df):
+    """Units sold and revenue per product."""
+    if sales_df.empty or products_df.empty:
+        return pd.DataFrame(columns=["product_id", "quantity_sold", "name", "cost_per_unit", "total_revenue"])
+    summary = sales_df.groupby("product_id")["quantity_sold"].sum().reset_index()
+    summary = summary.merge(products_df[["product_id", "name", "cost_per_unit"]], on="product_id", how="left")
+    summary["total_revenue"] = summary["quantity_sold"] * summary["cost_per_unit"]
+    return summary
+
+# ------------------- Supplier Totals Sidecar -------------------
+# supplier_totals.json stores the orders file stamp it was computed against, so it
+# can be trusted (and updated incrementally) only while that stamp still matches.
+def _load_supplier_totals():
+    """Return the saved per-supplier totals, or None if missing or out of date."""
+    if not os.path.exists(OrderManager.FILE_PATH):
+        return {}
+    stamp = list(_file_stamp(OrderManager.FILE_PATH))
+    memo = _totals_memo.get(_SUPPLIER_TOTALS_PATH)
+    if memo is None or memo[0] != stamp:
+        try:
+            with open(_SUPPLIER_TOTALS_PATH, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("stamp") != stamp:
+            return None
+        memo = (stamp, data.get("totals"))
+        _totals_memo[_SUPPLIER_TOTALS_PATH] = memo
+    # Callers adjust and re-save their copy; entries are replaced, never mutated in place.
+    return dict(memo[1])
+
+def _save_supplier_totals(totals):
+    """Store per-supplier totals stamped against the current orders file."""
+    if not os.path.exists(OrderManager.FILE_PATH):
+        return
+    stamp = list(_file_stamp(OrderManager.FILE_PATH))
+    with open(_SUPPLIER_TOTALS_PATH, "w", encoding="utf-8") as f:
+        json.dump({"stamp": stamp, "totals": totals}, f)
+    _totals_memo[_SUPPLIER_TOTALS_PATH] = (stamp, dict(totals))
+
+def _adjust_supplier_totals(totals, supplier_id, cost, count):
+    """Apply a change of `cost` and `count` orders to one supplier's entry."""
+    total, n = totals.get(supplier_id, [0.0, 0])
+    if n + count > 0:
+        totals[supplier_id] = [total + cost, n + count]
+    else:
+        totals.pop(supplier_id, None)
+
 # ------------------- Report Generators -------------------
 def generate_inventory_report():
     print("\n--- Generate Inventory Report ---")
-    threshold = input("Enter low stock threshold (default 10): ")
+    _warm_cache(ProductManager.FILE_PATH, SalesManager.FILE_PATH)
+    if _load_supplier_totals() is None:
+        # The order summary will be rebuilt from the orders table rather than the sidecar.
+        _warm_cache(OrderManager.FILE_PATH)
+    threshold = _ask("Enter low stock threshold (default 10): ")
     try:
         threshold = int(threshold) if threshold.strip() else 10
     except ValueError:
         print("❌ Invalid threshold. Using default (10).")
         threshold = 10
 
-    # Get data
-    low_stock_products = ProductManager.get_low_stock_products(threshold)
-    order_summary = OrderManager.get_order_summary_by_supplier()
-    sales_summary = SalesManager.get_sales_summary()
+    # Get data, loading each table once
+    try:
+        products_df = _read_or_empty(ProductManager.FILE_PATH, ProductManager.COLUMNS)
+        sales_df = _read_or_empty(SalesManager.FILE_PATH, SalesManager.COLUMNS)
+        low_stock_products = ProductManager.get_low_stock_products(threshold)
+        order_summary = OrderManager.get_order_summary_by_supplier()
+        sales_summary = _sales_summary(sales_df, products_df)
+    except Exception as e:
+        print(f"❌ Error generating report: {e}\n")
+        return
     
     # Create PDF
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -560,11 +1077,12 @@ def generate_inventory_report():
 
     # Order Summary
     elements.append(Paragraph("Order Summary by Supplier", styles['Heading2']))
-    if not order_summary:
+    if order_summary.empty:
         elements.append(Paragraph("No orders found.", styles['Normal']))
     else:
+        total_cost_str = order_summary["total_cost"].map("${:.2f}".format)
         data = [["Supplier ID", "Total Cost"]]
-        data += [[s["supplier_id"], f"${s['total_cost']:.2f}"] for s in order_summary]
+        data += order_summary.assign(total_cost=total_cost_str).to_numpy().tolist()
         table = Table(data)
         table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
@@ -581,11 +1099,13 @@ def generate_inventory_report():
 
     # Sales Summary
     elements.append(Paragraph("Sales Summary by Product", styles['Heading2']))
-    if not sales_summary:
+    if sales_summary.empty:
         elements.append(Paragraph("No sales found.", styles['Normal']))
     else:
+        total_revenue_str = sales_summary["total_revenue"].map("${:.2f}".format)
         data = [["Product ID", "Name", "Total Units Sold", "Total Revenue"]]
-        data += [[s["product_id"], s["name"], s["quantity_sold"], f"${s['total_revenue']:.2f}"] for s in sales_summary]
+        data += sales_summary.assign(total_revenue=total_revenue_str)[
+            ["product_id", "name", "quantity_sold", "total_revenue"]].to_numpy().tolist()
         table = Table(data)
         table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
@@ -607,21 +1127,19 @@ def generate_inventory_report():
 
 def generate_product_sales_report():
     print("\n--- Generate Product Sales Report ---")
-    product_id = input("Enter Product ID (e.g., PROD001): ")
-    if not ProductManager.is_valid_product_id(product_id):
-        print("❌ Product ID not found.")
-        return
+    product_id = _ask("Enter Product ID (e.g., PROD001): ")
 
-    # Get product name and cost per unit
-    products_df = pd.read_csv(ProductManager.FILE_PATH) if os.path.exists(ProductManager.FILE_PATH) else pd.DataFrame()
-    if products_df.empty or product_id not in products_df["product_id"].values:
-        print("❌ Product data not found.")
+    # Get product name and cost per unit with a single lookup
+    product = ProductManager.get_product(product_id)
+    if not product:
+        print("❌ Product ID not found.")
         return
-    product_name = products_df.loc[products_df["product_id"] == product_id, "name"].iloc[0]
-    cost_per_unit = products_df.loc[products_df["product_id"] == product_id, "cost_per_unit"].iloc[0]
+    product_name = product.name
+    cost_per_unit = product.cost_per_unit
     
     # Get sales data
-    product_sales = SalesManager.get_product_sales(product_id)
+    sales_df = _read_or_empty(SalesManager.FILE_PATH, SalesManager.COLUMNS)
+    product_sales = SalesManager.get_product_sales(product_id, sales_df)
     
     # Create PDF
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -677,12 +1195,12 @@ def generate_product_sales_report():
 def plot_order_summary():
     print("\n--- Order Summary Chart ---")
     summary = OrderManager.get_order_summary_by_supplier()
-    if not summary:
+    if summary.empty:
         print("No orders found for chart.\n")
         return
 
-    supplier_ids = [s["supplier_id"] for s in summary]
-    total_costs = [s["total_cost"] for s in summary]
+    supplier_ids = summary["supplier_id"].tolist()
+    total_costs = summary["total_cost"].tolist()
 
     plt.bar(supplier_ids, total_costs, orientation='vertical')
     plt.title("Total Order Costs by Supplier")
@@ -692,22 +1210,123 @@ def plot_order_summary():
     print()
 
 # ------------------- CLI Functions -------------------
+def _ask(prompt):
+    """Prompt for one line of input, reading stdin through its buffer (also fast when piped)."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line[:-1] if line.endswith("\n") else line
+
+# Table row builders: fetch a record's displayed fields in one C-level call.
+_SUPPLIER_ROW = attrgetter("supplier_id", "name", "location", "contact_info")
+_PRODUCT_ROW = attrgetter("product_id", "name", "sku", "cost_per_unit", "moq", "available_qty", "supplier_id")
+_ORDER_ROW = attrgetter("order_id", "product_id", "supplier_id", "quantity", "total_cost", "order_date", "delivery_status")
+
+def _cell_text(value):
+    """Format one table cell the way the grid tables always have (floats in "g" notation)."""
+    if value is None:
+        return ""
+    if isinstance(value, (float, np.floating)):
+        return format(value, "g")
+    return str(value)
+
+def _fraction_width(text):
+    """Return how many characters of a formatted number sit at or after its decimal point."""
+    point = text.rfind(".")
+    if point < 0:
+        point = text.lower().rfind("e")
+    return len(text) - point if point >= 0 else 0
+
+def _print_table(records, headers, row=tuple):
+    """Print `row(record)` for each record as a grid table, one line at a time.
+
+    Column widths are measured in a first pass, so no full table string is ever built.
+    Numeric columns are right-aligned with their decimal points lined up.
+    """
+    count = len(headers)
+    numeric = [None] * count  # None until the column has a non-empty value
+    text_width = [len(h) + 2 for h in headers]
+    int_width = [0] * count
+    frac_width = [0] * count
+    for record in records:
+        for i, value in enumerate(row(record)):
+            text = _cell_text(value)
+            text_width[i] = max(text_width[i], len(text))
+            if value is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float, np.integer, np.floating)):
+                numeric[i] = False
+                continue
+            if numeric[i] is None:
+                numeric[i] = True
+            frac = _fraction_width(text)
+            int_width[i] = max(int_width[i], len(text) - frac)
+            frac_width[i] = max(frac_width[i], frac)
+
+    widths = [max(text_width[i], int_width[i] + frac_width[i]) if numeric[i] else text_width[i]
+              for i in range(count)]
+    rule = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    # One format string per table, specialized to these widths and alignments.
+    line = "| " + " | ".join(f"{{:{'>' if numeric[i] else '<'}{w}}}" for i, w in enumerate(widths)) + " |"
+    row_line = (line + "\n" + rule).format
+    # Only numeric columns with a decimal part need their cells padded after the point.
+    decimal_columns = [i for i in range(count) if numeric[i] and frac_width[i]]
+
+    print(rule)
+    print(line.format(*headers))
+    print(rule.replace("-", "="))
+    for record in records:
+        cells = [_cell_text(value) for value in row(record)]
+        for i in decimal_columns:
+            cells[i] += " " * (frac_width[i] - _fraction_width(cells[i]))
+        print(row_line(*cells))
+
+# Rows shown per screen by _paginate.
+_PAGE_SIZE = 50
+
+def _paginate(records, headers, row=tuple):
+    """Print `records` one page at a time, prompting for the next page when there is more than one.
+
+    Piped (non-terminal) sessions get every row at once, so scripted input is never
+    mistaken for pager keys.
+    """
+    if not sys.stdin.isatty():
+        _print_table(records, headers, row)
+        return
+    pages = max(1, -(-len(records) // _PAGE_SIZE))
+    page = 0
+    while True:
+        start = page * _PAGE_SIZE
+        _print_table(records[start:start + _PAGE_SIZE], headers, row)
+        if pages == 1:
+            return
+        choice = _ask(f"Page {page + 1}/{pages} - [N]ext, [P]rev, [Q]uit: ").strip().lower()
+        if choice == "p":
+            page = max(page - 1, 0)
+        elif choice in ("", "n") and page < pages - 1:
+            page += 1
+        else:
+            # Q, any other key, or moving past the last page.
+            return
+
 def add_new_supplier():
     print("\n--- Add New Supplier ---")
-    name = input("Enter supplier name: ")
+    name = _ask("Enter supplier name: ")
     if not is_non_empty_string(name):
         print("❌ Supplier name cannot be empty.")
         return
-    location = input("Enter supplier location: ")
+    location = _ask("Enter supplier location: ")
     if not is_non_empty_string(location):
         print("❌ Location cannot be empty.")
         return
-    contact = input("Enter contact info (email or phone): ")
+    contact = _ask("Enter contact info (email or phone): ")
     if not is_valid_contact(contact):
         print("❌ Invalid contact info. Please enter a valid email or phone number.")
         return
 
-    confirm = input("Confirm adding supplier [Y/N]? ").lower()
+    confirm = _ask("Confirm adding supplier [Y/N]? ").lower()
     if confirm != "y":
         print("❌ Operation canceled.")
         return
@@ -719,25 +1338,25 @@ def add_new_supplier():
 
 def update_supplier():
     print("\n--- Update Supplier ---")
-    supplier_id = input("Enter Supplier ID (e.g., SUP001): ")
+    supplier_id = _ask("Enter Supplier ID (e.g., SUP001): ")
     if not SupplierManager.is_valid_supplier_id(supplier_id):
         print("❌ Supplier ID not found.")
         return
 
-    name = input("Enter new supplier name: ")
+    name = _ask("Enter new supplier name: ")
     if not is_non_empty_string(name):
         print("❌ Supplier name cannot be empty.")
         return
-    location = input("Enter new supplier location: ")
+    location = _ask("Enter new supplier location: ")
     if not is_non_empty_string(location):
         print("❌ Location cannot be empty.")
         return
-    contact = input("Enter new contact info (email or phone): ")
+    contact = _ask("Enter new contact info (email or phone): ")
     if not is_valid_contact(contact):
         print("❌ Invalid contact info. Please enter a valid email or phone number.")
         return
 
-    confirm = input("Confirm updating supplier [Y/N]? ").lower()
+    confirm = _ask("Confirm updating supplier [Y/N]? ").lower()
     if confirm != "y":
         print("❌ Operation canceled.")
         return
@@ -750,12 +1369,12 @@ def update_supplier():
 
 def delete_supplier():
     print("\n--- Delete Supplier ---")
-    supplier_id = input("Enter Supplier ID (e.g., SUP001): ")
+    supplier_id = _ask("Enter Supplier ID (e.g., SUP001): ")
     if not SupplierManager.is_valid_supplier_id(supplier_id):
         print("❌ Supplier ID not found.")
         return
 
-    confirm = input("Confirm deleting supplier [Y/N]? ").lower()
+    confirm = _ask("Confirm deleting supplier [Y/N]? ").lower()
     if confirm != "y":
         print("❌ Operation canceled.")
         return
@@ -773,13 +1392,12 @@ def view_all_suppliers():
         print("No suppliers found.\n")
         return
 
-    table = [[s.supplier_id, s.name, s.location, s.contact_info] for s in suppliers]
-    print(tabulate(table, headers=["ID", "Name", "Location", "Contact"], tablefmt="grid"))
+    _paginate(suppliers, ["ID", "Name", "Location", "Contact"], _SUPPLIER_ROW)
     print()
 
 def search_suppliers():
     print("\n--- Search Suppliers ---")
-    search_term = input("Enter name or location to search: ")
+    search_term = _ask("Enter name or location to search: ")
     if not is_non_empty_string(search_term):
         print("❌ Search term cannot be empty.")
         return
@@ -788,17 +1406,16 @@ def search_suppliers():
         print("No suppliers found matching the search term.\n")
         return
 
-    table = [[s.supplier_id, s.name, s.location, s.contact_info] for s in suppliers]
-    print(tabulate(table, headers=["ID", "Name", "Location", "Contact"], tablefmt="grid"))
+    _paginate(suppliers, ["ID", "Name", "Location", "Contact"], _SUPPLIER_ROW)
     print()
 
 def add_new_product():
     print("\n--- Add New Product ---")
-    name = input("Enter product name: ")
+    name = _ask("Enter product name: ")
     if not is_non_empty_string(name):
         print("❌ Product name cannot be empty.")
         return
-    sku = input("Enter SKU: ")
+    sku = _ask("Enter SKU: ")
     if not is_non_empty_string(sku):
         print("❌ SKU cannot be empty.")
         return
@@ -807,15 +1424,15 @@ def add_new_product():
         return
 
     try:
-        cost = float(input("Enter cost per unit: "))
+        cost = float(_ask("Enter cost per unit: "))
         if not is_positive_number(cost):
             print("❌ Cost per unit must be a positive number.")
             return
-        moq = int(input("Enter minimum order quantity (MOQ): "))
+        moq = int(_ask("Enter minimum order quantity (MOQ): "))
         if not is_positive_number(moq):
             print("❌ MOQ must be a positive integer.")
             return
-        qty = int(input("Enter available quantity: "))
+        qty = int(_ask("Enter available quantity: "))
         if not is_positive_number(qty):
             print("❌ Available quantity must be a positive integer.")
             return
@@ -823,12 +1440,12 @@ def add_new_product():
         print("❌ Invalid input. Please enter numeric values for cost and quantities.")
         return
 
-    supplier_id = input("Enter supplier ID (e.g., SUP001): ")
+    supplier_id = _ask("Enter supplier ID (e.g., SUP001): ")
     if not SupplierManager.is_valid_supplier_id(supplier_id):
         print("❌ Invalid Supplier ID.")
         return
 
-    confirm = input("Confirm adding product [Y/N]? ").lower()
+    confirm = _ask("Confirm adding product [Y/N]? ").lower()
     if confirm != "y":
         print("❌ Operation canceled.")
         return
@@ -840,30 +1457,30 @@ def add_new_product():
 
 def update_product():
     print("\n--- Update Product ---")
-    product_id = input("Enter Product ID (e.g., PROD001): ")
+    product_id = _ask("Enter Product ID (e.g., PROD001): ")
     if not ProductManager.is_valid_product_id(product_id):
         print("❌ Product ID not found.")
         return
 
-    name = input("Enter new product name: ")
+    name = _ask("Enter new product name: ")
     if not is_non_empty_string(name):
         print("❌ Product name cannot be empty.")
         return
-    sku = input("Enter new SKU: ")
+    sku = _ask("Enter new SKU: ")
     if not is_non_empty_string(sku):
         print("❌ SKU cannot be empty.")
         return
 
     try:
-        cost = float(input("Enter new cost per unit: "))
+        cost = float(_ask("Enter new cost per unit: "))
         if not is_positive_number(cost):
             print("❌ Cost per unit must be a positive number.")
             return
-        moq = int(input("Enter new minimum order quantity (MOQ): "))
+        moq = int(_ask("Enter new minimum order quantity (MOQ): "))
         if not is_positive_number(moq):
             print("❌ MOQ must be a positive integer.")
             return
-        qty = int(input("Enter new available quantity: "))
+        qty = int(_ask("Enter new available quantity: "))
         if not is_positive_number(qty):
             print("❌ Available quantity must be a positive integer.")
             return
@@ -871,12 +1488,12 @@ def update_product():
         print("❌ Invalid input. Please enter numeric values for cost and quantities.")
         return
 
-    supplier_id = input("Enter new supplier ID (e.g., SUP001): ")
+    supplier_id = _ask("Enter new supplier ID (e.g., SUP001): ")
     if not SupplierManager.is_valid_supplier_id(supplier_id):
         print("❌ Invalid Supplier ID.")
         return
 
-    confirm = input("Confirm updating product [Y/N]? ").lower()
+    confirm = _ask("Confirm updating product [Y/N]? ").lower()
     if confirm != "y":
         print("❌ Operation canceled.")
         return
@@ -890,12 +1507,12 @@ def update_product():
 
 def delete_product():
     print("\n--- Delete Product ---")
-    product_id = input("Enter Product ID (e.g., PROD001): ")
+    product_id = _ask("Enter Product ID (e.g., PROD001): ")
     if not ProductManager.is_valid_product_id(product_id):
         print("❌ Product ID not found.")
         return
 
-    confirm = input("Confirm deleting product [Y/N]? ").lower()
+    confirm = _ask("Confirm deleting product [Y/N]? ").lower()
     if confirm != "y":
         print("❌ Operation canceled.")
         return
@@ -908,19 +1525,18 @@ def delete_product():
 
 def view_all_products():
     print("\n--- All Products ---")
-    products = ProductManager.load_products()
-    if not products:
+    rows = ProductManager.get_rows()
+    if not rows:
         print("No products found.\n")
         return
 
-    table = [[p.product_id, p.name, p.sku, p.cost_per_unit, p.moq, p.available_qty, p.supplier_id]
-             for p in products]
-    print(tabulate(table, headers=["ID", "Name", "SKU", "Cost/Unit", "MOQ", "Available Qty", "Supplier ID"], tablefmt="grid"))
+    # Cached tuples already match the column layout, so they are printed as-is.
+    _paginate(rows, ["ID", "Name", "SKU", "Cost/Unit", "MOQ", "Available Qty", "Supplier ID"])
     print()
 
 def search_products():
     print("\n--- Search Products ---")
-    search_term = input("Enter name or SKU to search: ")
+    search_term = _ask("Enter name or SKU to search: ")
     if not is_non_empty_string(search_term):
         print("❌ Search term cannot be empty.")
         return
@@ -929,14 +1545,12 @@ def search_products():
         print("No products found matching the search term.\n")
         return
 
-    table = [[p.product_id, p.name, p.sku, p.cost_per_unit, p.moq, p.available_qty, p.supplier_id]
-             for p in products]
-    print(tabulate(table, headers=["ID", "Name", "SKU", "Cost/Unit", "MOQ", "Available Qty", "Supplier ID"], tablefmt="grid"))
+    _paginate(products, ["ID", "Name", "SKU", "Cost/Unit", "MOQ", "Available Qty", "Supplier ID"], _PRODUCT_ROW)
     print()
 
 def view_low_stock_products():
     print("\n--- Low Stock Products ---")
-    threshold = input("Enter low stock threshold (default 10): ")
+    threshold = _ask("Enter low stock threshold (default 10): ")
     try:
         threshold = int(threshold) if threshold.strip() else 10
         if not is_positive_number(threshold):
@@ -946,34 +1560,35 @@ def view_low_stock_products():
         print("❌ Invalid threshold. Using default (10).")
         threshold = 10
 
-    products = ProductManager.get_low_stock_products(threshold)
-    if not products:
+    # Rows are gathered from the matching positions only; listed because the pager needs len() and slicing.
+    rows = list(ProductManager.iter_low_stock_rows(threshold))
+    if not rows:
         print(f"No products with stock below {threshold}.\n")
         return
 
-    table = [[p.product_id, p.name, p.sku, p.available_qty, p.supplier_id]
-             for p in products]
-    print(tabulate(table, headers=["ID", "Name", "SKU", "Available Qty", "Supplier ID"], tablefmt="grid"))
+    _paginate(rows, ["ID", "Name", "SKU", "Available Qty", "Supplier ID"])
     print()
 
 def add_new_order():
     print("\n--- Add New Order ---")
-    product_id = input("Enter Product ID (e.g., PROD001): ")
+    # Parse the tables needed for validation while the user is typing.
+    _warm_cache(ProductManager.FILE_PATH, SupplierManager.FILE_PATH)
+    product_id = _ask("Enter Product ID (e.g., PROD001): ")
     if not ProductManager.is_valid_product_id(product_id):
         print("❌ Invalid Product ID.")
         return
 
-    supplier_id = input("Enter Supplier ID (e.g., SUP001): ")
+    supplier_id = _ask("Enter Supplier ID (e.g., SUP001): ")
     if not SupplierManager.is_valid_supplier_id(supplier_id):
         print("❌ Invalid Supplier ID.")
         return
 
     try:
-        quantity = int(input("Enter quantity: "))
+        quantity = int(_ask("Enter quantity: "))
         if not is_positive_number(quantity):
             print("❌ Quantity must be a positive integer.")
             return
-        cost_per_unit = float(input("Enter cost per unit: "))
+        cost_per_unit = float(_ask("Enter cost per unit: "))
         if not is_positive_number(cost_per_unit):
             print("❌ Cost per unit must be a positive number.")
             return
@@ -987,10 +1602,10 @@ def add_new_order():
         return
 
     total_cost = quantity * cost_per_unit
-    order_date = datetime.today().strftime("%Y-%m-%d")
+    order_date = date.today().isoformat()
     delivery_status = "Pending"
 
-    confirm = input("Confirm adding order [Y/N]? ").lower()
+    confirm = _ask("Confirm adding order [Y/N]? ").lower()
     if confirm != "y":
         print("❌ Operation canceled.")
         return
@@ -1002,17 +1617,16 @@ def add_new_order():
 
 def update_order_status():
     print("\n--- Update Order Status ---")
-    order_id = input("Enter Order ID (e.g., ORD001): ")
-    orders = OrderManager.load_orders()
-    if not any(o.order_id == order_id for o in orders):
+    order_id = _ask("Enter Order ID (e.g., ORD001): ")
+    if not OrderManager.get_order(order_id):
         print("❌ Order ID not found.")
         return
 
-    new_status = input("Enter new delivery status (e.g., Pending, Shipped, Delivered): ")
+    new_status = _ask("Enter new delivery status (e.g., Pending, Shipped, Delivered): ")
     if not is_non_empty_string(new_status):
         print("❌ Status cannot be empty.")
         return
-    confirm = input("Confirm updating order status [Y/N]? ").lower()
+    confirm = _ask("Confirm updating order status [Y/N]? ").lower()
     if confirm != "y":
         print("❌ Operation canceled.")
         return
@@ -1025,12 +1639,12 @@ def update_order_status():
 
 def delete_order():
     print("\n--- Delete Order ---")
-    order_id = input("Enter Order ID (e.g., ORD001): ")
-    if not any(o.order_id == order_id for o in OrderManager.load_orders()):
+    order_id = _ask("Enter Order ID (e.g., ORD001): ")
+    if not OrderManager.get_order(order_id):
         print("❌ Order ID not found.")
         return
 
-    confirm = input("Confirm deleting order [Y/N]? ").lower()
+    confirm = _ask("Confirm deleting order [Y/N]? ").lower()
     if confirm != "y":
         print("❌ Operation canceled.")
         return
@@ -1048,14 +1662,12 @@ def view_all_orders():
         print("No orders found.\n")
         return
 
-    table = [[o.order_id, o.product_id, o.supplier_id, o.quantity, o.total_cost, o.order_date, o.delivery_status]
-             for o in orders]
-    print(tabulate(table, headers=["ID", "Product ID", "Supplier ID", "Quantity", "Total Cost", "Order Date", "Status"], tablefmt="grid"))
+    _paginate(orders, ["ID", "Product ID", "Supplier ID", "Quantity", "Total Cost", "Order Date", "Status"], _ORDER_ROW)
     print()
 
 def search_orders():
     print("\n--- Search Orders ---")
-    search_term = input("Enter status or date to search: ")
+    search_term = _ask("Enter status or date to search: ")
     if not is_non_empty_string(search_term):
         print("❌ Search term cannot be empty.")
         return
@@ -1064,31 +1676,28 @@ def search_orders():
         print("No orders found matching the search term.\n")
         return
 
-    table = [[o.order_id, o.product_id, o.supplier_id, o.quantity, o.total_cost, o.order_date, o.delivery_status]
-             for o in orders]
-    print(tabulate(table, headers=["ID", "Product ID", "Supplier ID", "Quantity", "Total Cost", "Order Date", "Status"], tablefmt="grid"))
+    _paginate(orders, ["ID", "Product ID", "Supplier ID", "Quantity", "Total Cost", "Order Date", "Status"], _ORDER_ROW)
     print()
 
 def view_order_summary():
     print("\n--- Order Summary by Supplier ---")
     summary = OrderManager.get_order_summary_by_supplier()
-    if not summary:
+    if summary.empty:
         print("No orders found for summary.\n")
         return
 
-    table = [[s["supplier_id"], s["total_cost"]] for s in summary]
-    print(tabulate(table, headers=["Supplier ID", "Total Cost"], tablefmt="grid"))
+    _print_table(summary.to_numpy().tolist(), ["Supplier ID", "Total Cost"])
     print()
 
 def record_product_sale():
     print("\n--- Record Product Sale ---")
-    product_id = input("Enter Product ID (e.g., PROD001): ")
+    product_id = _ask("Enter Product ID (e.g., PROD001): ")
     if not ProductManager.is_valid_product_id(product_id):
         print("❌ Product ID not found.")
         return
 
     try:
-        quantity_sold = int(input("Enter quantity sold: "))
+        quantity_sold = int(_ask("Enter quantity sold: "))
         if not is_positive_number(quantity_sold):
             print("❌ Quantity sold must be a positive integer.")
             return
@@ -1104,89 +1713,84 @@ def record_product_sale():
 
     # Record sale
     sale_id = SalesManager.get_next_sale_id()
-    sale_date = datetime.today().strftime("%Y-%m-%d")
+    sale_date = date.today().isoformat()
     sale = Sale(sale_id, product_id, quantity_sold, sale_date)
     SalesManager.save_sale(sale)
     print(f"✅ Sale {sale_id} recorded successfully! {message}\n")
 
 # ------------------- Main Menu -------------------
+# Main menu text, printed with a single write.
+MENU = "\n".join([
+    "\n====== Bulk Supplier Management System ======",
+    "1. Add New Supplier",
+    "2. View All Suppliers",
+    "3. Update Supplier",
+    "4. Delete Supplier",
+    "5. Search Suppliers",
+    "6. Add New Product",
+    "7. View All Products",
+    "8. Update Product",
+    "9. Delete Product",
+    "10. Search Products",
+    "11. View Low Stock Products",
+    "12. Add New Order",
+    "13. View All Orders",
+    "14. Update Order Status",
+    "15. Delete Order",
+    "16. Search Orders",
+    "17. View Order Summary by Supplier",
+    "18. Generate Inventory Report (PDF)",
+    "19. View Order Summary Chart",
+    "20. Record Product Sale",
+    "21. Generate Sales Summary Report (PDF)",
+    "22. Generate Product Sales Report (PDF)",
+    "0. Exit",
+])
+
+# Menu choice -> CLI action.
+MENU_ACTIONS = {
+    "1": add_new_supplier,
+    "2": view_all_suppliers,
+    "3": update_supplier,
+    "4": delete_supplier,
+    "5": search_suppliers,
+    "6": add_new_product,
+    "7": view_all_products,
+    "8": update_product,
+    "9": delete_product,
+    "10": search_products,
+    "11": view_low_stock_products,
+    "12": add_new_order,
+    "13": view_all_orders,
+    "14": update_order_status,
+    "15": delete_order,
+    "16": search_orders,
+    "17": view_order_summary,
+    "18": generate_inventory_report,
+    "19": plot_order_summary,
+    "20": record_product_sale,
+    "21": generate_inventory_report,  # Reusing for sales summary
+    "22": generate_product_sales_report,
+}
+
 def main():
+    migrate_csv_tables()
     while True:
-        print("\n====== Bulk Supplier Management System ======")
-        print("1. Add New Supplier")
-        print("2. View All Suppliers")
-        print("3. Update Supplier")
-        print("4. Delete Supplier")
-        print("5. Search Suppliers")
-        print("6. Add New Product")
-        print("7. View All Products")
-        print("8. Update Product")
-        print("9. Delete Product")
-        print("10. Search Products")
-        print("11. View Low Stock Products")
-        print("12. Add New Order")
-        print("13. View All Orders")
-        print("14. Update Order Status")
-        print("15. Delete Order")
-        print("16. Search Orders")
-        print("17. View Order Summary by Supplier")
-        print("18. Generate Inventory Report (PDF)")
-        print("19. View Order Summary Chart")
-        print("20. Record Product Sale")
-        print("21. Generate Sales Summary Report (PDF)")
-        print("22. Generate Product Sales Report (PDF)")
-        print("0. Exit")
-        choice = input("Enter your choice: ")
-
-        if choice == "1":
-            add_new_supplier()
-        elif choice == "2":
-            view_all_suppliers()
-        elif choice == "3":
-            update_supplier()
-        elif choice == "4":
-            delete_supplier()
-        elif choice == "5":
-            search_suppliers()
-        elif choice == "6":
-            add_new_product()
-        elif choice == "7":
-            view_all_products()
-        elif choice == "8":
-            update_product()
-        elif choice == "9":
-            delete_product()
-        elif choice == "10":
-            search_products()
-        elif choice == "11":
-            view_low_stock_products()
-        elif choice == "12":
-            add_new_order()
-        elif choice == "13":
-            view_all_orders()
-        elif choice == "14":
-            update_order_status()
-        elif choice == "15":
-            delete_order()
-        elif choice == "16":
-            search_orders()
-        elif choice == "17":
-            view_order_summary()
-        elif choice == "18":
-            generate_inventory_report()
-        elif choice == "19":
-            plot_order_summary()
-        elif choice == "20":
-            record_product_sale()
-        elif choice == "21":
-            generate_inventory_report()  # Reusing for sales summary
-        elif choice == "22":
-            generate_product_sales_report()
-        elif choice == "0":
+        print(MENU)
+        choice = _ask("Enter your choice: ")
+
+        if choice == "0":
             print("👋 Exiting... Goodbye bro!")
             break
-        else:
+        action = MENU_ACTIONS.get(choice)
+        if action is None:
             print("❌ Invalid choice. Please try again.")
+        else:
+            # Files may have been edited outside the app between actions.
+            _invalidate_lookups()
+            action()
+            # Leave no stock change only in memory once the action is done.
+            _flush_pending()
 
 # ------------------- Run App -------------------
 if __name__ == "__main__":